@@ -1,23 +1,29 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationSystem:
     name: str
     version: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Variable:
     name: str
     value: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvVariableFilter:
     prefix: Optional[str | List[str]] = None
     suffix: Optional[str] = None
     contains: Optional[str] = None
     case_sensitive: bool = False
     exact_match: bool = False
+    # Normalized prefix, computed once so a single str.startswith call can check all of them
+    prefixes: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        prefixes = (self.prefix,) if isinstance(self.prefix, str) else tuple(self.prefix or ())
+        object.__setattr__(self, "prefixes", prefixes)
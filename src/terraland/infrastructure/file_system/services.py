@@ -1,6 +1,9 @@
+import os
 import shutil
 import subprocess
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 from terraland.domain.file_system.entities import SearchResult, SearchResultOutput, ListDirOutput
 from terraland.domain.file_system.services import BaseFileSystemService
@@ -78,22 +81,24 @@ class FileSystemService(BaseFileSystemService):
         command = ["grep", "-nr", pattern, str(self.work_dir)]
         try:
             result = subprocess.run(command, capture_output=True, check=True, text=True)
-            lines = result.stdout.splitlines()
-            filtered_lines = [line for line in lines if line.startswith(str(self.work_dir))]
-            total_search_result = len(filtered_lines)
+            work_dir = str(self.work_dir)
+            filtered_lines = (line for line in result.stdout.splitlines() if line.startswith(work_dir))
+            # Only the first result_limit lines are parsed, the rest are just counted
+            limited_lines = list(islice(filtered_lines, result_limit))
+            total_search_result = len(limited_lines) + sum(1 for _ in filtered_lines)
             results = [
                 SearchResult(
                     text=value[2].strip()[:text_limit],
                     file_name=str(Path(value[0]).relative_to(self.work_dir)),
                     line=int(value[1]),
                 )
-                for value in (line.split(":", 2) for line in filtered_lines[:result_limit])
+                for value in (line.split(":", 2) for line in limited_lines)
                 if len(value) == 3
             ]
             return SearchResultOutput(pattern=pattern, output=results, total=total_search_result)
 
         except subprocess.CalledProcessError as e:
-            raise FileSystemGrepException(e.stderr.decode())
+            raise FileSystemGrepException(e.stderr)
         except Exception as e:
             raise FileSystemGrepException(str(e))
 
@@ -165,15 +170,18 @@ class FileSystemService(BaseFileSystemService):
             files = []
             directories = []
 
-            entries = path.rglob("*") if recursively else path.iterdir()
+            if recursively:
+                entries = ((entry, entry.is_file()) for entry in path.rglob("*"))
+            else:
+                entries = self._scan_dir(path)
             items = 0
-            for entry in entries:
+            for entry, is_file in entries:
                 if max_items and items > max_items:
                     raise ListDirException(
                         f"Too many items, max processable dir size: {max_items}"
                     )
                 items += 1  # noqa SIM103
-                target = files if entry.is_file() else directories
+                target = files if is_file else directories
                 target.append(entry.relative_to(path) if relative_paths else entry)
             return ListDirOutput(
                 files=sorted(files, key=custom_sort_key),
@@ -184,6 +192,18 @@ class FileSystemService(BaseFileSystemService):
         except Exception as e:
             raise ListDirException(f"Error listing directory: {e}") from e
 
+    @staticmethod
+    def _scan_dir(path: Path) -> Iterator[tuple[Path, bool]]:
+        """
+        Yields the direct children of a directory along with whether each one is a file.
+
+        Uses os.scandir, so the file type usually comes from the directory listing itself
+        instead of a separate stat call per entry.
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                yield path / entry.name, entry.is_file()
+
     def create_file(self, path: Path, content: str | None = None) -> None:
         """
         Create a new file at the specified path.
@@ -43,13 +43,12 @@ class OperationSystemService(BaseOperationSystemService):
             List[Variable]: A list of environment variables. Each variable includes
                 its name and value.
         """
-        env_vars = list(os.environ.items())
-        if not vars_filter:
-            return [Variable(name=name, value=value) for name, value in env_vars]
+        if not vars_filter or not (vars_filter.prefixes or vars_filter.suffix or vars_filter.contains):
+            return [Variable(name=name, value=value) for name, value in os.environ.items()]
 
         return [
             Variable(name=name, value=value)
-            for name, value in env_vars
+            for name, value in os.environ.items()
             if self._env_var_name_matches_filter(name, vars_filter)
         ]
 
@@ -151,13 +150,8 @@ class OperationSystemService(BaseOperationSystemService):
         if vars_filter is None:
             return True
 
-        if vars_filter.prefix:
-            if isinstance(vars_filter.prefix, str):
-                if not name.startswith(vars_filter.prefix):
-                    return False
-            if isinstance(vars_filter.prefix, list):
-                if not any(name.startswith(prefix) for prefix in vars_filter.prefix):
-                    return False
+        if vars_filter.prefixes and not name.startswith(vars_filter.prefixes):
+            return False
 
         if vars_filter.suffix and not name.endswith(vars_filter.suffix):
             return False
@@ -3,6 +3,7 @@ import subprocess
 from typing import List, Tuple, Union, IO
 
 from terraland.domain.operation_system.services import BaseOperationSystemService
+from terraland.settings import COMMAND_PIPE_BUFFER_SIZE
 
 
 class CommandProcessContextManager:
@@ -53,6 +54,7 @@ class CommandProcessContextManager:
                 stderr=subprocess.PIPE,
                 stdin=subprocess.PIPE,
                 text=True,  # Returns strings instead of bytes
+                bufsize=COMMAND_PIPE_BUFFER_SIZE,
             )
 
             return self.process.stdin, self.process.stdout, self.process.stderr
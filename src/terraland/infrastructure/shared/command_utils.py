@@ -3,6 +3,9 @@ import re
 
 from terraland.infrastructure.shared.exceptions import CommandExecutionException
 
+INPUT_PROMPT = "Enter a value:"
+ANSI_ESCAPE_SEQUENCE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
 
 def process_stdout_stderr(stdout: IO, stderr: IO) -> Generator[str, None, None]:
     """
@@ -27,6 +30,11 @@ def process_stdout(stdout: IO):
     Reads characters from the stdout stream one by one, accumulating them into lines.
     Yields each line after cleaning up the command output, either when a newline
     character is encountered or when a specific prompt is detected.
+
+    The stream is read character by character on purpose: the command may be waiting
+    for user input after printing a prompt without a trailing newline, so reading a
+    whole line or the whole stream would block. The prompt is only looked for in the
+    tail of the line when its last character arrives, keeping the scan linear.
     
     Parameters:
         stdout (IO): The stdout stream from which to read the output.
@@ -36,9 +44,11 @@ def process_stdout(stdout: IO):
     """
     line = []
 
+    prompt_length = len(INPUT_PROMPT)
+
     for char in iter(lambda: stdout.read(1), ""):
         line.append(char)
-        if char == "\n" or "Enter a value:" in ''.join(line):
+        if char == "\n" or (char == INPUT_PROMPT[-1] and "".join(line[-prompt_length:]) == INPUT_PROMPT):
             yield clean_up_command_output(''.join(line))
             line.clear()
 
@@ -75,4 +85,6 @@ def process_stderr(stderr: IO):
 
 def clean_up_command_output(text: str):
     """Remove ANSI escape sequences from output."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", text).strip()
+    if "\x1b" not in text:
+        return text.strip()
+    return ANSI_ESCAPE_SEQUENCE_PATTERN.sub("", text).strip()
@@ -1,3 +1,4 @@
+import re
 import subprocess
 import uuid
 from pathlib import Path
@@ -10,6 +11,9 @@ from terraland.infrastructure.terraform.workspace.exceptions import (
     TerraformWorkspaceSwitchException,
 )
 
+# One workspace per line, the current workspace is marked with a leading "*"
+WORKSPACE_LINE_PATTERN = re.compile(r"^[ \t]*(?P<active>\*)?[* \t]*(?P<name>[^\s*][^\n]*?)[ \t\r]*$", re.MULTILINE)
+
 
 class WorkspaceService(BaseWorkspaceService):
     TERRAFORM_NOT_FOUND_MESSAGE = "Terraform command not found. Is it installed and in PATH?"
@@ -45,15 +49,13 @@ class WorkspaceService(BaseWorkspaceService):
                 text=True,
                 check=True,
             )
-            # Handle the * prefix that indicates current workspace
             workspaces = [
                 Workspace(
-                    uuid=f"id-{uuid.uuid5(uuid.NAMESPACE_DNS, workspace.strip().lstrip('* '))}",
-                    name=workspace.strip().lstrip("* "),
-                    is_active="*" in workspace,
+                    uuid=f"id-{uuid.uuid5(uuid.NAMESPACE_DNS, match['name'])}",
+                    name=match["name"],
+                    is_active=match["active"] is not None,
                 )
-                for workspace in result.stdout.split("\n")
-                if workspace.strip()
+                for match in WORKSPACE_LINE_PATTERN.finditer(result.stdout)
             ]
             return WorkspaceListOutput(workspaces=workspaces, command=command_str)
         except subprocess.CalledProcessError as e:
@@ -72,6 +72,12 @@ TERRAFORM_DESTROY_TIMEOUT: int = 1200  # 20 minutes
 TERRAFORM_VALIDATE_TIMEOUT: int = 600  # 10 minutes
 TERRAFORM_CONSOLE_TIMEOUT: int = 600  # 10 minutes
 
+# ------------------------------------------------------------------------------------------
+# Command execution settings
+# ------------------------------------------------------------------------------------------
+
+COMMAND_PIPE_BUFFER_SIZE: int = 65536  # 64 KiB, size of the Popen read/write buffers on the Python side
+
 # ------------------------------------------------------------------------------------------
 # Search settings
 # ------------------------------------------------------------------------------------------
@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def wired_container():
+    """
+    Provides the single DiContainer wired to the presentation layer and the test packages.
+
+    Wiring is global, the last wired container is the one every injection point resolves
+    from, so the integration and visual suites share this container instead of wiring their
+    own. It is wired once per session (once per worker with pytest-xdist); tests configure
+    it and override its providers for their own duration only.
+
+    The container is imported here rather than at module level so the unit suite does not
+    load the presentation layer.
+
+    :return: A wired DiContainer instance.
+    """
+    from terraland.presentation.cli.di_container import DiContainer
+
+    di_container = DiContainer()
+    di_container.wire(packages=["terraland.presentation.cli", "tests"])
+    yield di_container
+    di_container.unwire()
@@ -11,6 +11,20 @@ from terraland.domain.terraform.workspaces.entities import WorkspaceListOutput,
 from terraland.presentation.cli.di_container import DiContainer
 from terraland.presentation.cli.screens.main.main import TerraLand
 
+INTEGRATION_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Marks every integration test as ``slow``, since each of them boots the Textual application.
+
+    The hook receives the items of the whole session, so only the ones collected from this
+    directory are marked.
+    """
+    for item in items:
+        if INTEGRATION_TESTS_DIR in item.path.parents:
+            item.add_marker(pytest.mark.slow)
+
 
 @pytest.fixture
 def workspaces_list():
@@ -146,6 +160,7 @@ def operation_system_service() -> mock.Mock:
 @pytest.fixture
 def app(
     tmp_path: Path,
+    wired_container: DiContainer,
     workspace_service: mock.Mock,
     terraform_core_service: mock.Mock,
     file_system_service: mock.Mock,
@@ -153,11 +168,12 @@ def app(
 ):
     """
     Creates and initializes an TerraLand instance configured with the provided mock
-    services and temporary path. This pytest fixture is responsible for setting up
-    dependency injection and overriding the necessary services within the DI
-    container to facilitate unit testing.
+    services and temporary path. This pytest fixture is responsible for configuring
+    the shared DI container and overriding the necessary services within it to
+    facilitate unit testing.
 
     :param tmp_path: A temporary file system path used to represent work directory.
+    :param wired_container: The DI container wired once for the session.
     :param workspace_service: A mocked service for workspace-related operations.
     :param terraform_core_service: A mocked service for Terraform's core functionalities.
     :param file_system_service: A mocked service for file system-related operations.
@@ -167,16 +183,15 @@ def app(
 
     cache_mock = MagicMock()
     cache_mock.get.return_value = []
-    di_container = DiContainer()
-    di_container.config.work_dir.from_value(tmp_path)
-    di_container.config.animation_enabled.from_value(True)
-    di_container.cache.override(cache_mock)
-    di_container.wire(packages=["terraland.presentation.cli", "tests"])
-
-    with (
-        di_container.workspace_service.override(workspace_service),
-        di_container.file_system_service.override(file_system_service),
-        di_container.operation_system_service.override(operation_system_service),
-        di_container.terraform_core_service.override(terraform_core_service),
-    ):
-        return TerraLand(tmp_path)
+    wired_container.config.work_dir.from_value(tmp_path)
+    wired_container.config.animation_enabled.from_value(True)
+
+    with wired_container.cache.override(cache_mock):
+        with (
+            wired_container.workspace_service.override(workspace_service),
+            wired_container.file_system_service.override(file_system_service),
+            wired_container.operation_system_service.override(operation_system_service),
+            wired_container.terraform_core_service.override(terraform_core_service),
+        ):
+            app = TerraLand(tmp_path)
+        yield app
@@ -4,14 +4,29 @@ from textual.widget import Widget
 DEFAULT_SCREEN_ID = "_default"
 
 
+async def _scroll_into_view(pilot: Pilot, widget: Widget) -> None:
+    """
+    Scrolls the given widget into view, unless it is already entirely visible.
+
+    Args:
+        pilot: The pilot instance controlling the application.
+        widget: The widget that has to be visible before interacting with it.
+
+    """
+    if widget.screen.can_view_entire(widget):
+        return
+    widget.scroll_visible()
+    await pilot.pause()
+
+
 async def focus(pilot: Pilot, widget: Widget) -> None:
     """
     Focuses the given widget within the application's interface.
 
-    This asynchronous function ensures that the specified widget is brought
-    into the visible area of the application interface, pauses briefly for
-    potential visual updates, and then sets the focus to the widget. Another
-    pause is applied after the focus operation for stability.
+    This asynchronous function scrolls the specified widget into the visible
+    area of the application interface when it is not entirely visible, pausing
+    for the scroll to apply, and then sets the focus to the widget. A pause is
+    applied after the focus operation for stability.
 
     Args:
         pilot: The controlling interface or handler responsible for managing
@@ -19,8 +34,7 @@ async def focus(pilot: Pilot, widget: Widget) -> None:
         widget: The UI widget to be scrolled into view and focused.
 
     """
-    widget.scroll_visible()
-    await pilot.pause()
+    await _scroll_into_view(pilot, widget)
     widget.focus()
     await pilot.pause()
 
@@ -28,8 +42,8 @@ async def focus(pilot: Pilot, widget: Widget) -> None:
 async def click(pilot: Pilot, widget: Widget) -> None:
     """
     Executes a sequence of actions that simulates a user clicking on a widget. The actions include
-    scrolling the widget into view, hovering over it, clicking it, and introducing pauses for realistic
-    interaction simulation.
+    scrolling the widget into view when it is not entirely visible, hovering over it, clicking it, and
+    pausing afterwards for realistic interaction simulation.
 
     Args:
         pilot: The pilot instance controlling the simulation of user interactions. It provides methods
@@ -37,8 +51,7 @@ async def click(pilot: Pilot, widget: Widget) -> None:
         widget: The target widget to be interacted with during the sequence.
 
     """
-    widget.scroll_visible()
-    await pilot.pause()
+    await _scroll_into_view(pilot, widget)
     await pilot.hover(widget)
     await pilot.click(widget)
     await pilot.pause()
@@ -48,10 +61,10 @@ async def double_click(pilot: Pilot, widget: Widget) -> None:
     """
     Performs double-click action on a given widget.
 
-    This function scrolls the widget into the visible area, pauses,
-    hovers over the widget, and performs two consecutive clicks to
-    simulate a double-click event. Additional pauses are introduced
-    to ensure proper event handling.
+    This function scrolls the widget into the visible area when it is
+    not entirely visible, hovers over the widget, and performs two
+    consecutive clicks to simulate a double-click event. A pause is
+    introduced afterwards to ensure proper event handling.
 
     Args:
         pilot: The driver or controller responsible for simulating
@@ -60,8 +73,7 @@ async def double_click(pilot: Pilot, widget: Widget) -> None:
             performed.
 
     """
-    widget.scroll_visible()
-    await pilot.pause()
+    await _scroll_into_view(pilot, widget)
     await pilot.hover(widget)
     await pilot.click(widget)
     await pilot.click(widget)
@@ -78,8 +90,7 @@ async def enter(pilot: Pilot, widget: Widget) -> None:
         widget: The target widget being interacted with in the simulation.
 
     """
-    widget.scroll_visible()
-    await pilot.pause()
+    await _scroll_into_view(pilot, widget)
     widget.focus()
     await pilot.press("enter")
     await pilot.pause()
@@ -1,4 +1,5 @@
 from tests.unit.fixtures.file_system import *
 from tests.unit.fixtures.operation_system import *
+from tests.unit.fixtures.shared import *
 from tests.unit.fixtures.terraform_core import *
 from tests.unit.fixtures.terraform_workspace import *
@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -31,6 +32,31 @@ def temp_dir_with_files(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def listing_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture to provide a directory tree shared by the read-only listing tests"""
+    directory = tmp_path_factory.mktemp("listing") / "test_dir"
+    directory.mkdir()
+    (directory / "file1.txt").touch()
+    (directory / "file2.txt").touch()
+    (directory / "subdir").mkdir()
+    return directory
+
+
+@pytest.fixture(scope="session")
+def working_dir_with_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture to provide a working directory containing a single text file"""
+    directory = tmp_path_factory.mktemp("cmd_wd")
+    (directory / "test.txt").write_text("test content")
+    return directory
+
+
+@pytest.fixture
+def listing_file_system_service(listing_dir: Path) -> FileSystemService:
+    """Fixture to provide a FileSystemService instance rooted above the shared listing tree"""
+    return FileSystemService(listing_dir.parent)
+
+
 @pytest.fixture
 def file_system_service_with_grep_files(file_system_service):
     """Fixture to provide a FileSystemService instance with files for testing"""
@@ -43,5 +69,14 @@ def file_system_service_with_grep_files(file_system_service):
     ]
 
     file_system_service._mocked_grep_results = grep_results
+    file_system_service._mocked_grep_stdout = "\n".join(grep_results)
 
     return file_system_service
+
+
+@pytest.fixture
+def mocked_grep_run(patch_run, file_system_service_with_grep_files) -> SimpleNamespace:
+    """Fixture to replace subprocess.run with a successful grep returning the mocked results"""
+    result = SimpleNamespace(returncode=0, stdout=file_system_service_with_grep_files._mocked_grep_stdout)
+    patch_run(return_value=result)
+    return result
@@ -5,7 +5,7 @@ import pytest
 from terraland.infrastructure.operation_system.services import OperationSystemService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def operation_system_service():
     """Fixture to provide a OperationSystemService instance"""
     return OperationSystemService()
@@ -25,10 +25,11 @@ def mock_environment_variables(monkeypatch):
 
 
 @pytest.fixture(autouse=True)
-def cleanup_env_vars():
-    """Clean up environment variables after each test."""
-    initial_env = dict(os.environ)
-    yield
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(initial_env)
+def isolate_env_vars():
+    """Snapshot the process environment variables before each test and restore them afterward."""
+    snapshot = os.environ.copy()
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(snapshot)
@@ -0,0 +1,21 @@
+import subprocess
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def patch_run(monkeypatch):
+    """
+    Fixture to provide a setter replacing subprocess.run with a Mock.
+
+    The setter accepts the Mock's return_value and side_effect and returns the installed Mock,
+    so call assertions can be made on it. monkeypatch restores subprocess.run after the test.
+    """
+
+    def _patch_run(return_value=None, side_effect=None) -> Mock:
+        mock_run = Mock(return_value=return_value, side_effect=side_effect)
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return mock_run
+
+    return _patch_run
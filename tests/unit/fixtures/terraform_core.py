@@ -1,13 +1,21 @@
+from pathlib import Path
+
 import pytest
 
 from terraland.domain.terraform.core.entities import PlanSettings
 from terraland.infrastructure.terraform.core.services import TerraformCoreService
 
 
-@pytest.fixture
-def terraform_service(temp_dir, operation_system_service):
+@pytest.fixture(scope="module")
+def terraform_work_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture to provide a working directory shared by the services whose commands are mocked"""
+    return tmp_path_factory.mktemp("terraform")
+
+
+@pytest.fixture(scope="module")
+def terraform_service(terraform_work_dir, operation_system_service):
     """Fixture to provide a TerraformCoreService instance"""
-    return TerraformCoreService(temp_dir, operation_system_service)
+    return TerraformCoreService(terraform_work_dir, operation_system_service)
 
 
 @pytest.fixture
@@ -3,7 +3,7 @@ import pytest
 from terraland.infrastructure.terraform.workspace.services import WorkspaceService
 
 
-@pytest.fixture
-def workspace_service(temp_dir):
+@pytest.fixture(scope="module")
+def workspace_service(terraform_work_dir):
     """Fixture to provide a WorkspaceService instance"""
-    return WorkspaceService(temp_dir)
+    return WorkspaceService(terraform_work_dir)
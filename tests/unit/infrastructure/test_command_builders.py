@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from terraland.domain.terraform.core.entities import PlanSettings, InitSettings, ValidateSettings, ApplySettings, Variable
 from terraland.infrastructure.terraform.core.command_builders.terraform_apply_command_builder import \
     TerraformApplyCommandBuilder
@@ -20,51 +22,28 @@ class TestTerraformPlanCommandBuilder:
 
         assert command == ["terraform", "plan"]
 
-    def test_plan_command_with_refresh_only(self):
-        """Test plan command with refresh-only flag"""
-        settings = PlanSettings(refresh_only=True)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"refresh_only": True}, ["-refresh-only"]),
+            ({"destroy": True}, ["-destroy"]),
+            ({"norefresh": True}, ["-refresh=false"]),
+            (
+                {"inline_vars": [Variable(name="region", value="us-east-1"), Variable(name="env", value="prod")]},
+                ["-var", "region=us-east-1", "env=prod"],
+            ),
+            ({"var_files": ["prod.tfvars", "common.tfvars"]}, ["-var-file", "prod.tfvars", "common.tfvars"]),
+        ],
+        ids=["refresh_only", "destroy", "no_refresh", "inline_vars", "var_files"],
+    )
+    def test_plan_command_with_settings(self, kwargs, expected):
+        """Test plan command contains the arguments matching the settings"""
+        settings = PlanSettings(**kwargs)
         builder = TerraformPlanCommandBuilder()
         command = builder.build_from_settings(settings)
 
-        assert "-refresh-only" in command
-
-    def test_plan_command_with_destroy(self):
-        """Test plan command with destroy flag"""
-        settings = PlanSettings(destroy=True)
-        builder = TerraformPlanCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-destroy" in command
-
-    def test_plan_command_with_no_refresh(self):
-        """Test plan command with no refresh flag"""
-        settings = PlanSettings(norefresh=True)
-        builder = TerraformPlanCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-refresh=false" in command
-
-    def test_plan_command_with_inline_vars(self):
-        """Test plan command with inline variables"""
-        settings = PlanSettings(
-            inline_vars=[Variable(name="region", value="us-east-1"), Variable(name="env", value="prod")]
-        )
-        builder = TerraformPlanCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-var" in command
-        assert "region=us-east-1" in command
-        assert "env=prod" in command
-
-    def test_plan_command_with_var_files(self):
-        """Test plan command with variable files"""
-        settings = PlanSettings(var_files=["prod.tfvars", "common.tfvars"])
-        builder = TerraformPlanCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-var-file" in command
-        assert "prod.tfvars" in command
-        assert "common.tfvars" in command
+        for argument in expected:
+            assert argument in command
 
 
 class TestTerraformInitCommandBuilder:
@@ -76,45 +55,30 @@ class TestTerraformInitCommandBuilder:
 
         assert command == ["terraform", "init"]
 
-    def test_init_command_with_backend_config(self):
-        """Test init command with backend configuration"""
-        settings = InitSettings(backend_config={"key": "value", "region": "us-east-1"})
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {"backend_config": {"key": "value", "region": "us-east-1"}},
+                ["-backend-config", "key=value", "region=us-east-1"],
+            ),
+            (
+                {"backend_config_path": ["config1.hcl", "config2.hcl"]},
+                ["-backend-config", "config1.hcl", "config2.hcl"],
+            ),
+            ({"plugin_dir": ["plugins1", "plugins2"]}, ["-plugin-dir", "plugins1", "plugins2"]),
+            ({"test_directory": ["tests1", "tests2"]}, ["-test-directory", "tests1", "tests2"]),
+        ],
+        ids=["backend_config", "backend_config_path", "plugin_dir", "test_directory"],
+    )
+    def test_init_command_with_settings(self, kwargs, expected):
+        """Test init command contains the arguments matching the settings"""
+        settings = InitSettings(**kwargs)
         builder = TerraformInitCommandBuilder()
         command = builder.build_from_settings(settings)
 
-        assert "-backend-config" in command
-        assert "key=value" in command
-        assert "region=us-east-1" in command
-
-    def test_init_command_with_backend_config_path(self):
-        """Test init command with backend config file"""
-        settings = InitSettings(backend_config_path=["config1.hcl", "config2.hcl"])
-        builder = TerraformInitCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-backend-config" in command
-        assert "config1.hcl" in command
-        assert "config2.hcl" in command
-
-    def test_init_command_with_plugin_dir(self):
-        """Test init command with plugin directory"""
-        settings = InitSettings(plugin_dir=["plugins1", "plugins2"])
-        builder = TerraformInitCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-plugin-dir" in command
-        assert "plugins1" in command
-        assert "plugins2" in command
-
-    def test_init_command_with_test_directory(self):
-        """Test init command with test directory"""
-        settings = InitSettings(test_directory=["tests1", "tests2"])
-        builder = TerraformInitCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-test-directory" in command
-        assert "tests1" in command
-        assert "tests2" in command
+        for argument in expected:
+            assert argument in command
 
     def test_init_command_with_all_flags(self):
         """Test init command with all boolean flags"""
@@ -152,23 +116,22 @@ class TestTerraformValidateCommandBuilder:
 
         assert command == ["terraform", "validate"]
 
-    def test_validate_command_with_no_tests(self):
-        """Test validate command with no-tests flag"""
-        settings = ValidateSettings(no_tests=True)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"no_tests": True}, ["-no-tests"]),
+            ({"test_directory": ["tests1", "tests2"]}, ["-test-directory", "tests1", "tests2"]),
+        ],
+        ids=["no_tests", "test_directory"],
+    )
+    def test_validate_command_with_settings(self, kwargs, expected):
+        """Test validate command contains the arguments matching the settings"""
+        settings = ValidateSettings(**kwargs)
         builder = TerraformValidateCommandBuilder()
         command = builder.build_from_settings(settings)
 
-        assert "-no-tests" in command
-
-    def test_validate_command_with_test_directory(self):
-        """Test validate command with test directory"""
-        settings = ValidateSettings(test_directory=["tests1", "tests2"])
-        builder = TerraformValidateCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-test-directory" in command
-        assert "tests1" in command
-        assert "tests2" in command
+        for argument in expected:
+            assert argument in command
 
 
 class TestTerraformApplyCommandBuilder:
@@ -180,41 +143,27 @@ class TestTerraformApplyCommandBuilder:
 
         assert command == ["terraform", "apply"]
 
-    def test_apply_command_with_auto_approve(self):
-        """Test apply command with auto-approve"""
-        settings = ApplySettings(auto_approve=True)
-        builder = TerraformApplyCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-auto-approve" in command
-
-    def test_apply_command_with_backup_settings(self):
-        """Test apply command with backup settings"""
-        settings = ApplySettings(backup=Path("backup.tfstate"))
-        builder = TerraformApplyCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-backup" in command
-        assert "backup.tfstate" in command
-
-    def test_apply_command_with_disable_backup(self):
-        """Test apply command with disabled backup"""
-        settings = ApplySettings(disable_backup=True)
-        builder = TerraformApplyCommandBuilder()
-        command = builder.build_from_settings(settings)
-
-        assert "-backup=-" in command
-
-    def test_apply_command_with_state_settings(self):
-        """Test apply command with state settings"""
-        settings = ApplySettings(state=Path("current.tfstate"), state_out=Path("output.tfstate"))
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"auto_approve": True}, ["-auto-approve"]),
+            ({"backup": Path("backup.tfstate")}, ["-backup", "backup.tfstate"]),
+            ({"disable_backup": True}, ["-backup=-"]),
+            (
+                {"state": Path("current.tfstate"), "state_out": Path("output.tfstate")},
+                ["-state", "current.tfstate", "-state-out", "output.tfstate"],
+            ),
+        ],
+        ids=["auto_approve", "backup", "disable_backup", "state"],
+    )
+    def test_apply_command_with_settings(self, kwargs, expected):
+        """Test apply command contains the arguments matching the settings"""
+        settings = ApplySettings(**kwargs)
         builder = TerraformApplyCommandBuilder()
         command = builder.build_from_settings(settings)
 
-        assert "-state" in command
-        assert "current.tfstate" in command
-        assert "-state-out" in command
-        assert "output.tfstate" in command
+        for argument in expected:
+            assert argument in command
 
     def test_apply_command_with_all_flags(self):
         """Test apply command with all boolean flags"""
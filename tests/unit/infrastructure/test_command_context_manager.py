@@ -1,6 +1,14 @@
-from pathlib import Path
+import shutil
+import sys
+
+import pytest
+
 from terraland.infrastructure.shared.command_process_context_manager import CommandProcessContextManager
 
+HAS_POSIX_TOOLS = all(shutil.which(tool) for tool in ("sleep", "env", "cat", "ls", "echo"))
+
+pytestmark = pytest.mark.skipif(not HAS_POSIX_TOOLS, reason="POSIX shell tools required")
+
 
 def test_successful_command_execution(operation_system_service):
     """Test successful command execution and output capture"""
@@ -25,26 +33,15 @@ def test_command_with_error(operation_system_service):
         assert "No such file or directory" in error_output
 
 
-def test_command_with_working_directory(operation_system_service):
+def test_command_with_working_directory(operation_system_service, working_dir_with_file):
     """Test command execution in specific working directory"""
-    # Create a temporary directory and file
-    temp_dir = Path("test_dir")
-    temp_dir.mkdir(exist_ok=True)
-    temp_file = temp_dir / "test.txt"
-    temp_file.write_text("test content")
-
-    try:
-        with CommandProcessContextManager(["ls"], operation_system_service, cwd=str(temp_dir)) as (
-            stdin,
-            stdout,
-            stderr,
-        ):
-            output = stdout.read()
-            assert "test.txt" in output
-    finally:
-        # Cleanup
-        temp_file.unlink()
-        temp_dir.rmdir()
+    with CommandProcessContextManager(["ls"], operation_system_service, cwd=str(working_dir_with_file)) as (
+        stdin,
+        stdout,
+        stderr,
+    ):
+        output = stdout.read()
+        assert "test.txt" in output
 
 
 def test_command_with_environment_variables(operation_system_service):
@@ -55,6 +52,14 @@ def test_command_with_environment_variables(operation_system_service):
         assert "TEST_VAR=test_value" in output
 
 
+def test_command_with_large_output(operation_system_service):
+    """Test command output larger than the pipe buffer is fully read"""
+    command = [sys.executable, "-c", "print('x' * 200_000)"]
+    with CommandProcessContextManager(command, operation_system_service) as (stdin, stdout, stderr):
+        output = stdout.read()
+        assert output == "x" * 200_000 + "\n"
+
+
 def test_command_with_input(operation_system_service):
     """Test command with stdin input"""
     with CommandProcessContextManager(["cat"], operation_system_service) as (stdin, stdout, stderr):
@@ -67,7 +72,7 @@ def test_command_with_input(operation_system_service):
 
 def test_process_termination(operation_system_service):
     """Test process termination"""
-    manager = CommandProcessContextManager(["sleep", "10"], operation_system_service)
+    manager = CommandProcessContextManager(["sleep", "0.5"], operation_system_service)
     with manager as (stdin, stdout, stderr):
         # Verify process exists
         assert manager.process is not None
@@ -118,7 +123,7 @@ def test_text_mode_output(operation_system_service):
 
 def test_cleanup_on_exception(operation_system_service):
     """Test cleanup when an exception occurs"""
-    manager = CommandProcessContextManager(["sleep", "10"], operation_system_service)
+    manager = CommandProcessContextManager(["sleep", "0.5"], operation_system_service)
     try:
         with manager as (stdin, stdout, stderr):
             raise KeyboardInterrupt()
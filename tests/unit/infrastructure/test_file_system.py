@@ -1,12 +1,26 @@
+import os
 from pathlib import Path
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 import subprocess
 
 from terraland.infrastructure.file_system.services import FileSystemService
 from terraland.infrastructure.file_system.exceptions import FileSystemGrepException, ReadFileException, ListDirException
 from terraland.domain.file_system.entities import SearchResultOutput, ListDirOutput
 
+GREP_ERROR = subprocess.CalledProcessError(1, ["grep"], stderr="grep: error message")
+UNEXPECTED_ERROR = Exception("Unexpected error")
+
+
+def _touch(path: Path) -> Path:
+    path.touch()
+    return path
+
+
+def _mkdir(path: Path) -> Path:
+    path.mkdir(exist_ok=True)
+    return path
+
 
 class TestFileSystemService:
     @pytest.mark.parametrize(
@@ -37,39 +51,33 @@ class TestFileSystemService:
         assert "test1.tfstate" in state_files
         assert "subfolder/test2.tfstate" in state_files
 
+    @pytest.mark.usefixtures("mocked_grep_run")
     def test_grep_successful_search(self, file_system_service_with_grep_files):
         """Test successful grep search"""
 
         grep_results = file_system_service_with_grep_files._mocked_grep_results
-        mock_result = Mock()
-        mock_result.stdout = "\n".join(grep_results)
-        mock_result.returncode = 0
-
         max_response_number = 1
         max_response_length = 100
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = file_system_service_with_grep_files.grep("resource", max_response_number, max_response_length)
-            assert isinstance(result, SearchResultOutput)
-            assert result.total == len(grep_results)
-            assert len(result.output) == min(max_response_number, len(grep_results))
-            assert result.pattern == "resource"
+        result = file_system_service_with_grep_files.grep("resource", max_response_number, max_response_length)
+        assert isinstance(result, SearchResultOutput)
+        assert result.total == len(grep_results)
+        assert len(result.output) == min(max_response_number, len(grep_results))
+        assert result.pattern == "resource"
 
-    def test_grep_command_error(self, file_system_service):
+    def test_grep_command_error(self, file_system_service, patch_run):
         """Test grep command error handling"""
-        error = subprocess.CalledProcessError(1, ["grep"], stderr=b"grep: error message")
-
-        with patch("subprocess.run", side_effect=error):
-            with pytest.raises(FileSystemGrepException) as exc_info:
-                file_system_service.grep("pattern", 5, 100)
-            assert "grep: error message" in str(exc_info.value)
+        patch_run(side_effect=GREP_ERROR)
+        with pytest.raises(FileSystemGrepException) as exc_info:
+            file_system_service.grep("pattern", 5, 100)
+        assert "grep: error message" in str(exc_info.value)
 
-    def test_grep_general_error(self, file_system_service):
+    def test_grep_general_error(self, file_system_service, patch_run):
         """Test grep general error handling"""
-        with patch("subprocess.run", side_effect=Exception("Unexpected error")):
-            with pytest.raises(FileSystemGrepException) as exc_info:
-                file_system_service.grep("pattern", 5, 100)
-            assert "Unexpected error" in str(exc_info.value)
+        patch_run(side_effect=UNEXPECTED_ERROR)
+        with pytest.raises(FileSystemGrepException) as exc_info:
+            file_system_service.grep("pattern", 5, 100)
+        assert "Unexpected error" in str(exc_info.value)
 
     @pytest.mark.parametrize(
         "response_number,response_length",
@@ -81,20 +89,15 @@ class TestFileSystemService:
             (999999, 999999),  # Very large limits
         ],
     )
+    @pytest.mark.usefixtures("mocked_grep_run")
     def test_grep_with_edge_case_limits(self, file_system_service_with_grep_files, response_number, response_length):
         """Test grep with edge case limits"""
 
-        grep_results = file_system_service_with_grep_files._mocked_grep_results
-        mock_result = Mock()
-        mock_result.stdout = "\n".join(grep_results)
-        mock_result.returncode = 0
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = file_system_service_with_grep_files.grep("resource", response_number, response_length)
-            if response_number <= 0:
-                assert len(result.output) == 0
-            if response_length <= 0:
-                assert all(len(item.text) == 0 for item in result.output)
+        result = file_system_service_with_grep_files.grep("resource", response_number, response_length)
+        if response_number <= 0:
+            assert len(result.output) == 0
+        if response_length <= 0:
+            assert all(len(item.text) == 0 for item in result.output)
 
     def test_read(self, file_system_service):
         """Test reading file content"""
@@ -123,22 +126,16 @@ class TestFileSystemService:
             file_system_service.read(Path(tmp_file))
         tmp_file.unlink(missing_ok=True)
 
-    def test_general_error(self, file_system_service):
+    def test_general_error(self, file_system_service, monkeypatch):
         """Test general error"""
         (file_system_service.work_dir / "test.tf").touch()
-        with patch("pathlib.Path.read_text", side_effect=Exception("Unexpected error")):
-            with pytest.raises(ReadFileException):
-                file_system_service.read(Path(file_system_service.work_dir / "test.tf"))
+        monkeypatch.setattr(Path, "read_text", Mock(side_effect=UNEXPECTED_ERROR))
+        with pytest.raises(ReadFileException):
+            file_system_service.read(Path(file_system_service.work_dir / "test.tf"))
 
-    def test_list_dir_with_valid_path(self, file_system_service, tmp_path):
+    def test_list_dir_with_valid_path(self, listing_file_system_service, listing_dir):
         """Test listing directory with valid path"""
-        directory = tmp_path / "test_dir"
-        directory.mkdir()
-        (directory / "file1.txt").touch()
-        (directory / "file2.txt").touch()
-        (directory / "subdir").mkdir()
-
-        result = file_system_service.list_dir(path=directory, relative_paths=True)
+        result = listing_file_system_service.list_dir(path=listing_dir, relative_paths=True)
 
         assert isinstance(result, ListDirOutput)
         assert len(result.files) == 2
@@ -147,75 +144,49 @@ class TestFileSystemService:
         assert "file2.txt" in [f.name for f in result.files]
         assert "subdir" in [d.name for d in result.directories]
 
-    def test_list_dir_with_absolute_paths(self, file_system_service, tmp_path):
+    def test_list_dir_with_absolute_paths(self, listing_file_system_service, listing_dir):
         """Test listing directory with absolute paths"""
-        directory = tmp_path / "test_dir"
-        directory.mkdir()
-        (directory / "file.txt").touch()
-        (directory / "subdir").mkdir()
-
-        result = file_system_service.list_dir(path=directory, relative_paths=False)
+        result = listing_file_system_service.list_dir(path=listing_dir, relative_paths=False)
 
         assert isinstance(result, ListDirOutput)
-        assert len(result.files) == 1
+        assert len(result.files) == 2
         assert len(result.directories) == 1
-        assert directory / "file.txt" in result.files
-        assert directory / "subdir" in result.directories
-
-    def test_list_dir_path_not_found(self, file_system_service):
-        """Test listing directory with non-existing path"""
-        non_existing_path = Path("/non/existing/path")
-
-        with pytest.raises(ListDirException) as exc_info:
-            file_system_service.list_dir(path=non_existing_path)
-
-        assert "Directory not found" in str(exc_info.value)
-
-    def test_list_dir_path_is_not_a_directory(self, file_system_service, tmp_path):
-        """Test listing directory with a file path"""
-        file_path = tmp_path / "file.txt"
-        file_path.touch()
-
-        with pytest.raises(ListDirException) as exc_info:
-            file_system_service.list_dir(path=file_path)
-
-        assert "Path is not a directory" in str(exc_info.value)
-
-    def test_list_dir_path_outside_work_dir(self, file_system_service, tmp_path):
-        """Test listing directory with path outside work directory"""
-        outside_path = tmp_path.parent / "outside_dir"
-        outside_path.mkdir()
-
-        with pytest.raises(ListDirException) as exc_info:
-            file_system_service.list_dir(path=outside_path)
-
-        assert "Access denied: Path outside work directory" in str(exc_info.value)
-
-    def test_list_dir_path_not_path_object(self, file_system_service):
-        """Test listing directory with invalid path type"""
-        invalid_path = "/invalid/path"
+        assert listing_dir / "file1.txt" in result.files
+        assert listing_dir / "subdir" in result.directories
 
+    @pytest.mark.parametrize(
+        "path_factory,message",
+        [
+            (lambda tmp_path: Path("/non/existing/path"), "Directory not found"),
+            (lambda tmp_path: _touch(tmp_path / "file.txt"), "Path is not a directory"),
+            (lambda tmp_path: _mkdir(tmp_path.parent / "outside_dir"), "Access denied: Path outside work directory"),
+            (lambda tmp_path: "/invalid/path", "Path must be a Path object"),
+        ],
+        ids=["not_found", "not_a_directory", "outside_work_dir", "not_path_object"],
+    )
+    def test_list_dir_invalid_path(self, file_system_service, tmp_path, path_factory, message):
+        """Test listing directory with an invalid path"""
         with pytest.raises(ListDirException) as exc_info:
-            file_system_service.list_dir(path=invalid_path)
+            file_system_service.list_dir(path=path_factory(tmp_path))
 
-        assert "Path must be a Path object" in str(exc_info.value)
+        assert message in str(exc_info.value)
 
-    def test_access_denied(self, tmp_path, file_system_service):
+    def test_access_denied(self, tmp_path, file_system_service, monkeypatch):
         """Test access denied error"""
         directory = tmp_path / "test_dir"
         directory.mkdir()
+        monkeypatch.setattr(os, "scandir", Mock(side_effect=PermissionError("Access denied")))
 
-        with patch("pathlib.Path.iterdir", side_effect=PermissionError("Access denied")):
-            with pytest.raises(ListDirException) as exc_info:
-                file_system_service.list_dir(path=directory)
-            assert "Access denied" in str(exc_info.value)
+        with pytest.raises(ListDirException) as exc_info:
+            file_system_service.list_dir(path=directory)
+        assert "Access denied" in str(exc_info.value)
 
-    def test_general_exception(self, tmp_path, file_system_service):
+    def test_general_exception(self, tmp_path, file_system_service, monkeypatch):
         """Test access denied error"""
         directory = tmp_path / "test_dir"
         directory.mkdir()
+        monkeypatch.setattr(os, "scandir", Mock(side_effect=Exception("message")))
 
-        with patch("pathlib.Path.iterdir", side_effect=Exception("message")):
-            with pytest.raises(ListDirException) as exc_info:
-                file_system_service.list_dir(path=directory)
-            assert "message" in str(exc_info.value)
+        with pytest.raises(ListDirException) as exc_info:
+            file_system_service.list_dir(path=directory)
+        assert "message" in str(exc_info.value)
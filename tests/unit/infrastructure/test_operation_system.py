@@ -28,11 +28,9 @@ class TestOperationSystemService:
         """Test if `list_environment_variables` returns all environment variables when no filter is provided."""
         result = operation_system_service.list_environment_variables()
         assert isinstance(result, list)
+        assert all(isinstance(env_var, Variable) for env_var in result)
+        assert {env_var.name: env_var.value for env_var in result} == mock_environment_variables
         assert len(result) == len(mock_environment_variables)
-        for env_var in result:
-            assert isinstance(env_var, Variable)
-            assert env_var.name in mock_environment_variables
-            assert env_var.value == mock_environment_variables[env_var.name]
 
     def test_list_environment_variables_with_filter(self, operation_system_service, mock_environment_variables):
         """Test if `list_environment_variables` returns filtered environment variables."""
@@ -52,12 +50,9 @@ class TestOperationSystemService:
         assert isinstance(result, list)
         assert len(result) == 2
         # Verify specific variables
-
-        assert any(var.name == "FILTER_VAR" and var.value == mock_environment_variables["FILTER_VAR"] for var in result)
-
-        assert any(
-            var.name == "ANOTHER_VAR" and var.value == mock_environment_variables["ANOTHER_VAR"] for var in result
-        )
+        by_name = {var.name: var.value for var in result}
+        assert by_name["FILTER_VAR"] == mock_environment_variables["FILTER_VAR"]
+        assert by_name["ANOTHER_VAR"] == mock_environment_variables["ANOTHER_VAR"]
 
     def test_list_environment_variables_with_empty_prefix_list(
         self, operation_system_service, mock_environment_variables
@@ -84,71 +79,42 @@ class TestOperationSystemService:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    def test_set_environment_variable_sets_value(self, operation_system_service):
-        key = "TEST_KEY"
-        value = "TEST_VALUE"
-
-        operation_system_service.set_environment_variable(key, value)
-
-        assert os.environ[key] == value
-
-    def test_set_environment_variable_with_empty_value(self, operation_system_service):
-        key = "TEST_KEY"
-        value = ""
-
+    @pytest.mark.parametrize(
+        "key,value",
+        [
+            ("TEST_KEY", "TEST_VALUE"),
+            ("TEST_KEY", ""),
+            ("TEST@KEY!", "TEST_VALUE"),
+            ("TEST_KEY", "A" * 10_000),
+        ],
+        ids=["value", "empty_value", "special_characters_in_key", "large_value"],
+    )
+    def test_set_environment_variable_sets_value(self, operation_system_service, key, value):
         operation_system_service.set_environment_variable(key, value)
 
         assert os.environ[key] == value
 
-    def test_set_environment_variable_overwrites_existing_value(self, operation_system_service):
+    def test_set_environment_variable_overwrites_existing_value(self, operation_system_service, monkeypatch):
         key = "TEST_KEY"
         initial_value = "INITIAL_VALUE"
         new_value = "NEW_VALUE"
 
-        os.environ[key] = initial_value
+        monkeypatch.setenv(key, initial_value)
         operation_system_service.set_environment_variable(key, new_value)
 
         assert os.environ[key] == new_value
 
-    def test_set_environment_variable_with_invalid_key(self, operation_system_service):
-        key = None
-        value = "TEST_VALUE"
-
-        with pytest.raises(EnvVarOperationSystemException):
-            operation_system_service.set_environment_variable(key, value)
-
-    def test_set_environment_variable_with_empty_key(self, operation_system_service):
-        key = ""
-        value = "TEST_VALUE"
-
-        with pytest.raises(EnvVarOperationSystemException):
-            operation_system_service.set_environment_variable(key, value)
-
-    def test_set_environment_variable_with_non_str_value(self, operation_system_service):
-        key = "test"
-        value = 123
-
+    @pytest.mark.parametrize(
+        "key,value",
+        [(None, "TEST_VALUE"), ("", "TEST_VALUE"), ("test", 123)],
+        ids=["none_key", "empty_key", "non_str_value"],
+    )
+    def test_set_environment_variable_with_invalid_arguments(self, operation_system_service, key, value):
         with pytest.raises(EnvVarOperationSystemException):
             operation_system_service.set_environment_variable(key, value)
 
-    def test_set_environment_variable_with_special_characters_in_key(self, operation_system_service):
-        key = "TEST@KEY!"
-        value = "TEST_VALUE"
-
-        operation_system_service.set_environment_variable(key, value)
-
-        assert os.environ[key] == value
-
-    def test_set_environment_variable_with_large_value(self, operation_system_service):
-        key = "TEST_KEY"
-        value = "A" * 10_000
-
-        operation_system_service.set_environment_variable(key, value)
-
-        assert os.environ[key] == value
-
-    def test_unset_environment_variable_removes_existing_var(self, operation_system_service):
-        os.environ["TEST_VAR"] = "value"
+    def test_unset_environment_variable_removes_existing_var(self, operation_system_service, monkeypatch):
+        monkeypatch.setenv("TEST_VAR", "value")
 
         operation_system_service.unset_environment_variable("TEST_VAR")
 
@@ -159,20 +125,17 @@ class TestOperationSystemService:
 
         assert result is None  # Since the function uses os.environ.pop(key, None)
 
-    def test_unset_environment_variable_with_empty_key(self, operation_system_service):
-        with pytest.raises(EnvVarOperationSystemException):
-            operation_system_service.unset_environment_variable("")
-
-    def test_unset_environment_variable_with_special_characters_in_key(self, operation_system_service):
-        os.environ["TEST@VAR$"] = "value"
+    def test_unset_environment_variable_with_special_characters_in_key(self, operation_system_service, monkeypatch):
+        monkeypatch.setenv("TEST@VAR$", "value")
 
         operation_system_service.unset_environment_variable("TEST@VAR$")
 
         assert "TEST@VAR$" not in os.environ
 
-    def test_unset_environment_variable_with_invalid_type_key(self, operation_system_service):
+    @pytest.mark.parametrize("key", ["", 123], ids=["empty_key", "invalid_type_key"])
+    def test_unset_environment_variable_with_invalid_key(self, operation_system_service, key):
         with pytest.raises(EnvVarOperationSystemException):
-            operation_system_service.unset_environment_variable(123)  # Invalid type for key
+            operation_system_service.unset_environment_variable(key)
 
     def test_get_environment_variable_returns_correct_value(self, monkeypatch, operation_system_service):
         monkeypatch.setenv("TEST_VAR", "test_value")
@@ -201,39 +164,40 @@ class TestOperationSystemService:
         assert result.name == "SPECIAL_KEY!@#$"
         assert result.value == "special_value"
 
-    def test_env_var_name_matches_filter_with_prefix(self, operation_system_service):
-        vars_filter = EnvVariableFilter(prefix="TEST_")
-        assert operation_system_service._env_var_name_matches_filter("TEST_VAR", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("VAR_TEST", vars_filter)
-
-    def test_env_var_name_matches_filter_with_suffix(self, operation_system_service):
-        vars_filter = EnvVariableFilter(suffix="_SUFFIX")
-        assert operation_system_service._env_var_name_matches_filter("VAR_SUFFIX", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("SUFFIX_VAR", vars_filter)
-
-    def test_env_var_name_matches_filter_with_contains(self, operation_system_service):
-        vars_filter = EnvVariableFilter(contains="MID")
-        assert operation_system_service._env_var_name_matches_filter("VAR_MID_VAR", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("VAR_VAR", vars_filter)
-
-    def test_env_var_name_matches_filter_with_no_filter(self, operation_system_service):
-        vars_filter = EnvVariableFilter()
-        assert operation_system_service._env_var_name_matches_filter("ANY_VAR", vars_filter)
-
-    def test_env_var_name_matches_filter_with_combined_filters(self, operation_system_service):
-        vars_filter = EnvVariableFilter(prefix="TEST_", suffix="_SUFFIX", contains="MID")
-        assert operation_system_service._env_var_name_matches_filter("TEST_MID_SUFFIX", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("TEST_SUFFIX_MID", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("MID_TEST_SUFFIX", vars_filter)
-
-    def test_env_var_name_matches_filter_with_none_filter(self, operation_system_service):
-        assert operation_system_service._env_var_name_matches_filter("ANY_VAR", None)
-
-    def test_env_var_name_matches_filter_with_empty_filter_values(self, operation_system_service):
-        vars_filter = EnvVariableFilter(prefix="", suffix="", contains="")
-        assert operation_system_service._env_var_name_matches_filter("ANY_VAR", vars_filter)
-
-    def test_env_var_name_matches_filter_with_special_chars(self, operation_system_service):
-        vars_filter = EnvVariableFilter(prefix="@#$")
-        assert operation_system_service._env_var_name_matches_filter("@#$VAR", vars_filter)
-        assert not operation_system_service._env_var_name_matches_filter("VAR", vars_filter)
+    @pytest.mark.parametrize(
+        "name,vars_filter,expected",
+        [
+            ("TEST_VAR", EnvVariableFilter(prefix="TEST_"), True),
+            ("VAR_TEST", EnvVariableFilter(prefix="TEST_"), False),
+            ("VAR_SUFFIX", EnvVariableFilter(suffix="_SUFFIX"), True),
+            ("SUFFIX_VAR", EnvVariableFilter(suffix="_SUFFIX"), False),
+            ("VAR_MID_VAR", EnvVariableFilter(contains="MID"), True),
+            ("VAR_VAR", EnvVariableFilter(contains="MID"), False),
+            ("ANY_VAR", EnvVariableFilter(), True),
+            ("TEST_MID_SUFFIX", EnvVariableFilter(prefix="TEST_", suffix="_SUFFIX", contains="MID"), True),
+            ("TEST_SUFFIX_MID", EnvVariableFilter(prefix="TEST_", suffix="_SUFFIX", contains="MID"), False),
+            ("MID_TEST_SUFFIX", EnvVariableFilter(prefix="TEST_", suffix="_SUFFIX", contains="MID"), False),
+            ("ANY_VAR", None, True),
+            ("ANY_VAR", EnvVariableFilter(prefix="", suffix="", contains=""), True),
+            ("@#$VAR", EnvVariableFilter(prefix="@#$"), True),
+            ("VAR", EnvVariableFilter(prefix="@#$"), False),
+        ],
+        ids=[
+            "prefix_match",
+            "prefix_mismatch",
+            "suffix_match",
+            "suffix_mismatch",
+            "contains_match",
+            "contains_mismatch",
+            "no_filter",
+            "combined_match",
+            "combined_wrong_order",
+            "combined_wrong_prefix",
+            "none_filter",
+            "empty_filter_values",
+            "special_chars_match",
+            "special_chars_mismatch",
+        ],
+    )
+    def test_env_var_name_matches_filter(self, operation_system_service, name, vars_filter, expected):
+        assert operation_system_service._env_var_name_matches_filter(name, vars_filter) is expected
@@ -1,6 +1,6 @@
 import json
 import subprocess
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,69 +12,59 @@ from terraland.infrastructure.terraform.core.exceptions import (
 )
 from terraland.infrastructure.terraform.core.services import TerraformCoreService
 
+MOCK_VERSION = {
+    "terraform_version": "1.5.0",
+    "platform": "linux_amd64",
+    "provider_selections": {},
+    "terraform_outdated": False,
+}
+MOCK_VERSION_JSON = json.dumps(MOCK_VERSION).encode()
+
 
 class TestTerraformCoreService:
-    def test_init_with_string_path(self, temp_dir, operation_system_service):
-        service = TerraformCoreService(str(temp_dir), operation_system_service)
-        assert isinstance(service.work_dir, str)
-        assert service.work_dir == str(temp_dir)
+    VERSION_RUN_KWARGS = {"capture_output": True, "check": True, "timeout": 30}
 
-    def test_init_with_path_object(self, temp_dir, operation_system_service):
-        service = TerraformCoreService(temp_dir, operation_system_service)
+    @pytest.mark.parametrize("wrap", [str, lambda path: path], ids=["str", "path"])
+    def test_init(self, temp_dir, operation_system_service, wrap):
+        service = TerraformCoreService(wrap(temp_dir), operation_system_service)
         assert isinstance(service.work_dir, str)
         assert service.work_dir == str(temp_dir)
 
-    def test_version_success(self, terraform_service):
-        terraform_version = "1.5.0"
-        terraform_platform = "linux_amd64"
-        terraform_outdated = False
-
-        mock_version = {
-            "terraform_version": terraform_version,
-            "platform": terraform_platform,
-            "provider_selections": {},
-            "terraform_outdated": terraform_outdated,
-        }
-        mock_result = Mock(stdout=json.dumps(mock_version).encode(), stderr=b"", returncode=0)
+    def test_version_success(self, terraform_service, patch_run):
+        mock_result = SimpleNamespace(stdout=MOCK_VERSION_JSON, stderr=b"", returncode=0)
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = terraform_service.version()
+        mock_run = patch_run(return_value=mock_result)
+        result = terraform_service.version()
 
-            assert isinstance(result, TerraformVersion)
-            assert result.terraform_version == terraform_version
-            assert result.platform == terraform_platform
-            assert result.terraform_outdated == terraform_outdated
+        assert isinstance(result, TerraformVersion)
+        assert result.terraform_version == MOCK_VERSION["terraform_version"]
+        assert result.platform == MOCK_VERSION["platform"]
+        assert result.terraform_outdated == MOCK_VERSION["terraform_outdated"]
 
-            mock_run.assert_called_once_with(
-                ["terraform", "version", "-json"],
-                cwd=terraform_service.work_dir,
-                capture_output=True,
-                check=True,
-                timeout=30,
-            )
+        mock_run.assert_called_once_with(
+            ["terraform", "version", "-json"],
+            cwd=terraform_service.work_dir,
+            **self.VERSION_RUN_KWARGS,
+        )
 
-    def test_version_timeout(self, terraform_service):
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(["terraform"], 30)):
-            with pytest.raises(TerraformVersionException) as exc_info:
-                terraform_service.version()
-            assert "Version check timed out after 30s" in str(exc_info.value)
+    def test_version_timeout(self, terraform_service, patch_run):
+        patch_run(side_effect=subprocess.TimeoutExpired(["terraform"], 30))
+        with pytest.raises(TerraformVersionException, match="Version check timed out after 30s"):
+            terraform_service.version()
 
-    def test_version_command_error(self, terraform_service):
+    def test_version_command_error(self, terraform_service, patch_run):
         error = subprocess.CalledProcessError(1, ["terraform"], stderr="terraform not found")
-        with patch("subprocess.run", side_effect=error):
-            with pytest.raises(TerraformVersionException) as exc_info:
-                terraform_service.version()
-            assert "terraform not found" in str(exc_info.value)
+        patch_run(side_effect=error)
+        with pytest.raises(TerraformVersionException, match="terraform not found"):
+            terraform_service.version()
 
-    def test_version_invalid_json(self, terraform_service):
-        mock_result = Mock(stdout=b"invalid json", stderr=b"", returncode=0)
-        with patch("subprocess.run", return_value=mock_result):
-            with pytest.raises(TerraformVersionException) as exc_info:
-                terraform_service.version()
-            assert "Invalid version output format" in str(exc_info.value)
+    def test_version_invalid_json(self, terraform_service, patch_run):
+        mock_result = SimpleNamespace(stdout=b"invalid json", stderr=b"", returncode=0)
+        patch_run(return_value=mock_result)
+        with pytest.raises(TerraformVersionException, match="Invalid version output format"):
+            terraform_service.version()
 
-    def test_version_general_error(self, terraform_service):
-        with patch("subprocess.run", side_effect=Exception("Unexpected error")):
-            with pytest.raises(TerraformVersionException) as exc_info:
-                terraform_service.version()
-            assert "Unexpected error" in str(exc_info.value)
+    def test_version_general_error(self, terraform_service, patch_run):
+        patch_run(side_effect=Exception("Unexpected error"))
+        with pytest.raises(TerraformVersionException, match="Unexpected error"):
+            terraform_service.version()
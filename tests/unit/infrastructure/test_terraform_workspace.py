@@ -1,6 +1,8 @@
+import re
 import subprocess
 import pytest
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 
 from terraland.infrastructure.terraform.workspace.services import WorkspaceService
@@ -10,104 +12,103 @@ from terraland.infrastructure.terraform.workspace.exceptions import (
 )
 from terraland.domain.terraform.workspaces.entities import WorkspaceListOutput
 
+MOCK_WORKSPACES = [
+    "  default",
+    "* development",
+    "  production",
+]
+MOCK_WORKSPACES_OUTPUT = "\n".join(MOCK_WORKSPACES)
+
 
 class TestWorkspaceService:
-    def test_init_with_string_path(self, temp_dir):
-        service = WorkspaceService(str(temp_dir))
-        assert isinstance(service.work_dir, str)
-        assert service.work_dir == str(temp_dir)
+    RUN_KWARGS = {"capture_output": True, "text": True, "check": True}
 
-    def test_init_with_path_object(self, temp_dir):
-        service = WorkspaceService(temp_dir)
+    @pytest.mark.parametrize("wrap", [str, lambda path: path], ids=["str", "path"])
+    def test_init(self, temp_dir, wrap):
+        service = WorkspaceService(wrap(temp_dir))
         assert isinstance(service.work_dir, str)
         assert service.work_dir == str(temp_dir)
 
-    def test_list_success(self, workspace_service):
-        workspaces = [
-            "  default",
-            "* development",
-            "  production",
-        ]
+    def test_list_success(self, workspace_service, patch_run):
         command = ["terraform", "workspace", "list"]
 
-        mock_result = Mock(stdout="\n".join(workspaces), stderr="", returncode=0)
+        mock_result = SimpleNamespace(stdout=MOCK_WORKSPACES_OUTPUT, stderr="", returncode=0)
+
+        mock_run = patch_run(return_value=mock_result)
+        result = workspace_service.list()
+
+        assert isinstance(result, WorkspaceListOutput)
+        assert len(result.workspaces) == len(MOCK_WORKSPACES)
+        assert result.command == " ".join(command)
+
+        # Verify workspaces
+        workspaces = [(w.name, w.is_active) for w in result.workspaces]
+        assert workspaces == [
+            ("default", False),
+            ("development", True),
+            ("production", False),
+        ]
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = workspace_service.list()
+        # Verify command execution
+        mock_run.assert_called_once_with(command, cwd=workspace_service.work_dir, **self.RUN_KWARGS)
 
-            assert isinstance(result, WorkspaceListOutput)
-            assert len(result.workspaces) == len(workspaces)
-            assert result.command == " ".join(command)
+    def test_list_skips_blank_lines_and_carriage_returns(self, workspace_service, patch_run):
+        stdout = "  default\r\n\r\n* development  \r\n\n"
+        patch_run(return_value=SimpleNamespace(stdout=stdout, stderr="", returncode=0))
 
-            # Verify workspaces
-            workspaces = [(w.name, w.is_active) for w in result.workspaces]
-            assert workspaces == [
-                ("default", False),
-                ("development", True),
-                ("production", False),
-            ]
+        result = workspace_service.list()
 
-            # Verify command execution
-            mock_run.assert_called_once_with(
-                command, cwd=workspace_service.work_dir, capture_output=True, text=True, check=True
-            )
+        assert [(w.name, w.is_active) for w in result.workspaces] == [("default", False), ("development", True)]
 
-    def test_list_command_error(self, workspace_service):
+    def test_list_command_error(self, workspace_service, patch_run):
         error = "Error: Workspace does not exist"
         error_mock = Mock(side_effect=subprocess.CalledProcessError(1, [], stderr=error))
-        with patch("subprocess.run", side_effect=error_mock):
-            with pytest.raises(TerraformWorkspaceListException) as exc_info:
-                workspace_service.list()
-            assert error in str(exc_info.value)
-
-    def test_list_terraform_not_found(self, workspace_service):
-        with patch("subprocess.run", side_effect=FileNotFoundError()):
-            with pytest.raises(TerraformWorkspaceListException) as exc_info:
-                workspace_service.list()
-            assert workspace_service.TERRAFORM_NOT_FOUND_MESSAGE in str(exc_info.value)
-
-    def test_list_general_error(self, workspace_service):
-        with patch("subprocess.run", side_effect=Exception("Unexpected error")):
-            with pytest.raises(TerraformWorkspaceListException) as exc_info:
-                workspace_service.list()
-            assert "Unexpected error" in str(exc_info.value)
-
-    def test_switch_success(self, workspace_service):
+        patch_run(side_effect=error_mock)
+        with pytest.raises(TerraformWorkspaceListException, match=re.escape(error)):
+            workspace_service.list()
+
+    def test_list_terraform_not_found(self, workspace_service, patch_run):
+        patch_run(side_effect=FileNotFoundError())
+        with pytest.raises(
+            TerraformWorkspaceListException, match=re.escape(workspace_service.TERRAFORM_NOT_FOUND_MESSAGE)
+        ):
+            workspace_service.list()
+
+    def test_list_general_error(self, workspace_service, patch_run):
+        patch_run(side_effect=Exception("Unexpected error"))
+        with pytest.raises(TerraformWorkspaceListException, match="Unexpected error"):
+            workspace_service.list()
+
+    def test_switch_success(self, workspace_service, patch_run):
         workspace_name = "development"
-        mock_result = Mock(stdout=f'Switched to workspace "{workspace_name}".', stderr="", returncode=0)
+        mock_result = SimpleNamespace(stdout=f'Switched to workspace "{workspace_name}".', stderr="", returncode=0)
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            workspace_service.switch(workspace_name)
+        mock_run = patch_run(return_value=mock_result)
+        workspace_service.switch(workspace_name)
 
-            mock_run.assert_called_once_with(
-                ["terraform", "workspace", "select", workspace_name],
-                cwd=workspace_service.work_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        mock_run.assert_called_once_with(
+            ["terraform", "workspace", "select", workspace_name],
+            cwd=workspace_service.work_dir,
+            **self.RUN_KWARGS,
+        )
 
     def test_switch_empty_name(self, workspace_service):
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Workspace name cannot be empty"):
             workspace_service.switch("")
-        assert "Workspace name cannot be empty" in str(exc_info.value)
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Workspace name cannot be empty"):
             workspace_service.switch("   ")
-        assert "Workspace name cannot be empty" in str(exc_info.value)
 
-    def test_switch_command_error(self, workspace_service):
+    def test_switch_command_error(self, workspace_service, patch_run):
         error = 'Error: Workspace "non-existent" doesn\'t exist'
-        with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, [], stderr=error)):
-            with pytest.raises(TerraformWorkspaceSwitchException) as exc_info:
-                workspace_service.switch("non-existent")
-            assert error in str(exc_info.value)
-
-    def test_switch_general_error(self, workspace_service):
-        with patch("subprocess.run", side_effect=Exception("Unexpected error")):
-            with pytest.raises(TerraformWorkspaceSwitchException) as exc_info:
-                workspace_service.switch("workspace")
-            assert "Unexpected error" in str(exc_info.value)
+        patch_run(side_effect=subprocess.CalledProcessError(1, [], stderr=error))
+        with pytest.raises(TerraformWorkspaceSwitchException, match=re.escape(error)):
+            workspace_service.switch("non-existent")
+
+    def test_switch_general_error(self, workspace_service, patch_run):
+        patch_run(side_effect=Exception("Unexpected error"))
+        with pytest.raises(TerraformWorkspaceSwitchException, match="Unexpected error"):
+            workspace_service.switch("workspace")
 
     # -------------------------------------------------------------------------------------------------------------------
     # Todo: refer to following code snippet after workspace create method is implemented
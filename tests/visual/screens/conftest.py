@@ -108,31 +108,35 @@ def file_system_service() -> mock.Mock:
 
 @pytest.fixture
 def app(
-    tmp_path: Path, workspace_service: mock.Mock, terraform_core_service: mock.Mock, file_system_service: mock.Mock
+    tmp_path: Path,
+    wired_container: DiContainer,
+    workspace_service: mock.Mock,
+    terraform_core_service: mock.Mock,
+    file_system_service: mock.Mock,
 ):
     """
     Creates and initializes an TerraLand instance configured with the provided mock
-    services and temporary path. This pytest fixture is responsible for setting up
-    dependency injection and overriding the necessary services within the DI
-    container to facilitate unit testing.
+    services and temporary path. This pytest fixture is responsible for configuring
+    the shared DI container and overriding the necessary services within it to
+    facilitate unit testing.
 
     :param tmp_path: A temporary file system path used to represent work directory.
+    :param wired_container: The DI container wired once for the session.
     :param workspace_service: A mocked service for workspace-related operations.
     :param terraform_core_service: A mocked service for Terraform's core functionalities.
     :param file_system_service: A mocked service for file system-related operations.
     :return: An instance of TerraLand configured for testing.
     """
-    di_container = DiContainer()
-    di_container.config.work_dir.from_value(tmp_path)
-    di_container.config.animation_enabled.from_value(False)
+    wired_container.config.work_dir.from_value(tmp_path)
+    wired_container.config.animation_enabled.from_value(False)
     cache_mock = mock.MagicMock()
-    cache_mock.get.return_value = None
-    di_container.cache.override(cache_mock)
-    di_container.wire(packages=["terraland.presentation.cli", "tests"])
-
-    with (
-        di_container.workspace_service.override(workspace_service),
-        di_container.file_system_service.override(file_system_service),
-        di_container.terraform_core_service.override(terraform_core_service),
-    ):
-        return TerraLand(work_dir=tmp_path)
+    cache_mock.get.return_value = []
+
+    with wired_container.cache.override(cache_mock):
+        with (
+            wired_container.workspace_service.override(workspace_service),
+            wired_container.file_system_service.override(file_system_service),
+            wired_container.terraform_core_service.override(terraform_core_service),
+        ):
+            app = TerraLand(work_dir=tmp_path)
+        yield app